@@ -7,22 +7,46 @@ It handles audio encoding, S3 uploads, and static site generation.
 """
 
 import os
-import re
 import sys
 import subprocess
 import shutil
 import argparse
 import hashlib
+import json
+import logging
+import logging.handlers
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
 import yaml
 import boto3
-from botocore.exceptions import ClientError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from botocore.exceptions import BotoCoreError, ClientError
 from dotenv import load_dotenv
-from jinja2 import Environment, FileSystemLoader
-import markdown2
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+import cmarkgfm
+from cmarkgfm.cmark import Options as CmarkOptions
+
+# Use the libyaml C parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# File extensions recognised in a track folder (lowercase, with the dot)
+_MARKDOWN_EXTS = frozenset({'.md'})
+_WAV_EXTS = frozenset({'.wav'})
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+
+
+log = logging.getLogger('giraffe')
 
 
 # Load environment variables
@@ -44,11 +68,100 @@ class Config:
         self.github_username = os.getenv('GITHUB_USERNAME', 'yourusername')
         self.mp3_bitrate = os.getenv('MP3_BITRATE', '192')
         self.mp3_quality = os.getenv('MP3_QUALITY', '2')
+        # Worker counts below 1 would make the thread pools raise
+        self.encode_jobs = max(1, int(os.getenv('GIRAFFE_ENCODE_JOBS') or os.cpu_count() or 1))
+        self.upload_jobs = max(1, int(os.getenv('GIRAFFE_UPLOAD_JOBS') or 16))
+        self.s3_multipart_chunksize_mb = max(1, int(os.getenv('S3_MULTIPART_CHUNKSIZE_MB') or 16))
+        self.s3_max_pool_connections = max(1, int(os.getenv('S3_MAX_POOL_CONNECTIONS') or 64))
 
         # Validate required config
         if not self.s3_bucket or not self.s3_base_url:
-            print("Warning: S3 configuration not complete. Audio files won't be uploaded.")
-            print("Set S3_BUCKET_NAME and S3_BASE_URL in .env file")
+            log.warning("Warning: S3 configuration not complete. Audio files won't be uploaded.")
+            log.warning("Set S3_BUCKET_NAME and S3_BASE_URL in .env file")
+
+
+def _file_hash(path: Path) -> str:
+    """Hash a file's contents with blake2b, reading 1 MiB at a time"""
+    h = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _fast_copy(src, dest):
+    """Hard-link src to dest, falling back to a real copy across filesystems"""
+    # Replace rather than write through an existing file (it may itself be a link)
+    if os.path.lexists(dest):
+        os.unlink(dest)
+    try:
+        os.link(src, dest)
+    except OSError:
+        shutil.copy2(src, dest)
+    return dest
+
+
+def _same_stat(src, dest) -> bool:
+    """Check whether dest exists with the same size and mtime as src
+
+    True for a hard link or an earlier copy2 of src.
+    """
+    try:
+        dest_stat = os.stat(dest)
+    except FileNotFoundError:
+        return False
+    src_stat = os.stat(src)
+    return (src_stat.st_size == dest_stat.st_size
+            and src_stat.st_mtime_ns == dest_stat.st_mtime_ns)
+
+
+def _copy_if_changed(src, dest):
+    """Copy src to dest unless dest already has the same size and mtime"""
+    if _same_stat(src, dest):
+        return dest
+    return _fast_copy(src, dest)
+
+
+def _dump_atomic(stream, output_file: Path) -> None:
+    """Write a template stream to a temp file, then move it into place
+
+    Readers never see a half-written page, even if the build is interrupted.
+    """
+    tmp_file = output_file.with_name(output_file.name + '.tmp')
+    try:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            stream.dump(f)
+        os.replace(tmp_file, output_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def _split_frontmatter(content: str) -> Optional[tuple[str, str]]:
+    """Split YAML frontmatter between '---' lines from the markdown body
+
+    Returns (frontmatter, body), or None if the frontmatter isn't closed.
+    """
+    first, newline, rest = content.partition('\n')
+    if not newline or first.removesuffix('\r').rstrip(' \t') != '---':
+        return None
+
+    # Find the first closing '---' line
+    start = 0
+    while (end := rest.find('\n---', start)) != -1:
+        line, newline, body = rest[end + 4:].partition('\n')
+        if newline:
+            line = line.removesuffix('\r')
+        if not line.strip(' \t'):
+            return (rest[:end].removesuffix('\r'), body)
+        start = end + 1
+
+    return None
+
+
+def render_markdown(text: str) -> str:
+    """Render markdown to HTML with libcmark (raw HTML is passed through)"""
+    return cmarkgfm.markdown_to_html(text, options=CmarkOptions.CMARK_OPT_UNSAFE)
 
 
 class Track:
@@ -59,73 +172,133 @@ class Track:
         self.slug = directory.name
         self.metadata = {}
         self.content = ""
+        self.content_digest = ""  # SHA-1 of the markdown body, set with markdown_cache
+        self.md_path = None
         self.wav_path = None
         self.mp3_path = None
         self.cover_path = None
         self.image_paths = []  # All images in the track folder
+        self._image_filenames = []  # Output filenames, set by find_files()
+        self._cover_filename = ""
         self.mp3_url = ""
         self.wav_url = ""
-
-    def load_metadata(self) -> bool:
-        """Load metadata from markdown file"""
-        md_files = list(self.directory.glob('*.md'))
+        self._scanned = False  # Directory listing, filled in by _scan()
+        self._md_files = []
+        self._wav_files = []
+        self._image_files = []
+
+    def _scan(self) -> None:
+        """List the track directory once and bucket files by extension"""
+        if self._scanned:
+            return
+
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                ext = os.path.splitext(entry.name)[1].lower()
+                if not ext or not entry.is_file():
+                    continue
+                if ext in _MARKDOWN_EXTS:
+                    self._md_files.append(Path(entry.path))
+                elif ext in _WAV_EXTS:
+                    self._wav_files.append(Path(entry.path))
+                elif ext in _IMAGE_EXTS:
+                    self._image_files.append(Path(entry.path))
+
+        # Sort by name for consistent ordering
+        for files in (self._md_files, self._wav_files, self._image_files):
+            files.sort(key=lambda p: p.name)
+        self._scanned = True
+
+    def load_metadata(self, cache: Optional[Dict] = None,
+                      markdown_cache: Optional[Dict] = None) -> bool:
+        """Load metadata from markdown file
+
+        If a cache dict is given, parsed metadata and rendered content are
+        reused while the markdown file's mtime is unchanged, and stored
+        back into the cache after parsing. If a markdown_cache dict is given,
+        rendered HTML is looked up by the SHA-1 of the markdown body, so a
+        touched or frontmatter-only edit doesn't re-render the body.
+        """
+        self._scan()
+        md_files = self._md_files
         if not md_files:
-            print(f"Warning: No .md file found in {self.directory}")
+            log.warning(f"Warning: No .md file found in {self.directory}")
             return False
 
         md_file = md_files[0]
+        self.md_path = md_file
 
         try:
+            mtime = md_file.stat().st_mtime_ns
+            if cache is not None:
+                cached = cache.get(str(md_file))
+                if cached and len(cached) == 4 and cached[0] == mtime:
+                    _, self.metadata, self.content, self.content_digest = cached
+                    return True
+
             with open(md_file, 'r', encoding='utf-8') as f:
                 content = f.read()
 
             # Parse YAML frontmatter
             if content.startswith('---'):
-                parts = content.split('---', 2)
-                if len(parts) >= 3:
-                    self.metadata = yaml.safe_load(parts[1]) or {}
-                    self.content = markdown2.markdown(parts[2].strip())
+                parts = _split_frontmatter(content)
+                if parts:
+                    frontmatter, body = parts
+                    self.metadata = yaml.load(frontmatter, Loader=_YAMLLoader) or {}
+                    body = body.strip()
+                    if markdown_cache is None:
+                        self.content = render_markdown(body)
+                    else:
+                        self.content_digest = hashlib.sha1(body.encode('utf-8')).hexdigest()
+                        self.content = markdown_cache.get(self.content_digest)
+                        if self.content is None:
+                            self.content = render_markdown(body)
+                            markdown_cache[self.content_digest] = self.content
                 else:
-                    print(f"Warning: Invalid frontmatter in {md_file}")
+                    log.warning(f"Warning: Invalid frontmatter in {md_file}")
                     return False
             else:
-                print(f"Warning: No frontmatter found in {md_file}")
+                log.warning(f"Warning: No frontmatter found in {md_file}")
                 return False
 
             # Validate required fields
             if 'title' not in self.metadata:
-                print(f"Warning: No title in {md_file}")
+                log.warning(f"Warning: No title in {md_file}")
                 return False
 
+            if cache is not None:
+                cache[str(md_file)] = (mtime, self.metadata, self.content, self.content_digest)
+
             return True
 
         except Exception as e:
-            print(f"Error reading {md_file}: {e}")
+            log.error(f"Error reading {md_file}: {e}")
             return False
 
     def find_files(self) -> bool:
         """Find WAV and cover image files"""
+        self._scan()
+
         # Find WAV file
-        wav_files = list(self.directory.glob('*.wav')) + list(self.directory.glob('*.WAV'))
+        wav_files = self._wav_files
         if wav_files:
             self.wav_path = wav_files[0]
         else:
-            print(f"Warning: No WAV file found in {self.directory}")
+            log.warning(f"Warning: No WAV file found in {self.directory}")
             return False
 
         # Find all image files (for carousel support)
-        image_extensions = ['jpg', 'jpeg', 'png', 'gif', 'webp', 'JPG', 'JPEG', 'PNG', 'GIF', 'WEBP']
-        for ext in image_extensions:
-            self.image_paths.extend(self.directory.glob(f'*.{ext}'))
+        self.image_paths = list(self._image_files)
 
-        # Sort images by name for consistent ordering
-        self.image_paths = sorted(self.image_paths, key=lambda p: p.name)
+        # Output filenames are prefixed with the slug to avoid collisions
+        self._image_filenames = [f"{self.slug}-{img.name}" for img in self.image_paths]
 
         # First image is the primary cover
         if self.image_paths:
             self.cover_path = self.image_paths[0]
+            self._cover_filename = self._image_filenames[0]
         else:
-            print(f"Warning: No cover image found in {self.directory}")
+            log.warning(f"Warning: No cover image found in {self.directory}")
             return False
 
         return True
@@ -162,57 +335,226 @@ class Track:
     @property
     def cover_filename(self) -> str:
         """Get the filename of the primary cover image"""
-        if self.cover_path:
-            return f"{self.slug}-{self.cover_path.name}"
-        return ""
+        return self._cover_filename
 
     @property
     def image_filenames(self) -> List[str]:
         """Get filenames of all images for this track"""
-        return [f"{self.slug}-{img.name}" for img in self.image_paths]
+        return self._image_filenames
+
+
+def _ffmpeg_threads(jobs: int) -> int:
+    """Split the CPUs between `jobs` concurrent ffmpeg processes"""
+    return max(1, (os.cpu_count() or 1) // max(1, jobs))
+
+
+# Seconds an ffmpeg encode may take (or, when streaming, go without
+# producing output) before it is killed
+_FFMPEG_TIMEOUT = 300
+
+
+def _lame_args(bitrate: str, quality: str) -> List[str]:
+    """ffmpeg rate-control arguments for libmp3lame
+
+    libmp3lame honors only one of -b:a and -q:a (VBR wins when both are
+    given), so use constant bitrate when MP3_BITRATE is set and VBR
+    quality otherwise.
+    """
+    if bitrate:
+        return ['-b:a', f'{bitrate}k']
+    return ['-q:a', quality]
+
+
+def _encode_mp3(wav_path: Path, mp3_path: Path, bitrate: str, quality: str,
+                threads: int = 0) -> tuple[Optional[Path], str, str]:
+    """Encode WAV to MP3 using ffmpeg
+
+    Runs in a worker thread; ffmpeg itself is a separate process.
+    threads=0 lets ffmpeg pick its own thread count.
+
+    Returns:
+        tuple: (mp3_path, wav_hash, error)
+        - mp3_path: Path to the encoded MP3, or None on failure
+        - wav_hash: Content hash of the WAV on success, "" otherwise
+        - error: ffmpeg stderr or exception message on failure, "" otherwise
+    """
+    cmd = [
+        'ffmpeg',
+        '-nostdin',  # Never wait on the terminal
+        '-hide_banner',
+        '-nostats',
+        '-loglevel', 'error',  # Only report failures
+        '-i', str(wav_path),
+        '-codec:a', 'libmp3lame',
+        *_lame_args(bitrate, quality),
+        '-threads', str(threads),
+        '-y',  # Overwrite output file
+        str(mp3_path)
+    ]
+
+    try:
+        result = subprocess.run(cmd,
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.PIPE,
+                              text=True,
+                              timeout=_FFMPEG_TIMEOUT)
+        if result.returncode == 0:
+            # Hash here rather than in the result loop, while the WAV is still cached
+            return (mp3_path, _file_hash(wav_path), "")
+        else:
+            return (None, "", result.stderr)
+    except subprocess.TimeoutExpired:
+        return (None, "", "ffmpeg timed out")
+    except Exception as e:
+        return (None, "", str(e))
+
+
+class _StallGuard:
+    """Read a process's stdout, killing the process if it stops producing output
+
+    Only time spent blocked on the process counts towards the timeout, so a
+    slow reader (an upload on a slow link) never trips it. read() collects
+    the requested size from smaller reads, so steady output keeps resetting
+    the clock.
+    """
+
+    def __init__(self, proc: subprocess.Popen, timeout: float):
+        self.proc = proc
+        self.timeout = timeout
+        self.timed_out = False
+        self._waiting_since = None  # monotonic time the current read started
+        self._done = threading.Event()
+        self._watcher = threading.Thread(target=self._watch, daemon=True)
+        self._watcher.start()
+
+    def _watch(self) -> None:
+        while not self._done.wait(min(1, self.timeout)):
+            since = self._waiting_since
+            if since is not None and time.monotonic() - since > self.timeout:
+                self.timed_out = True
+                self.proc.kill()
+                return
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            self._waiting_since = time.monotonic()
+            try:
+                chunk = self.proc.stdout.read1(remaining if size >= 0 else 1 << 16)
+            finally:
+                self._waiting_since = None
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        """Stop watching (the process's stdout is left open)"""
+        self._done.set()
 
 
 class GiraffeBuilder:
     """Main builder class"""
 
-    def __init__(self, static_only=False):
+    def __init__(self, static_only=False, keep_local=False):
         self.config = Config()
         self.static_only = static_only
+        self.keep_local = keep_local
         self.base_dir = Path(__file__).parent
         self.tracks_dir = self.base_dir / 'tracks'
         self.output_dir = self.base_dir / 'docs'
         self.templates_dir = self.base_dir / 'templates'
         self.assets_dir = self.base_dir / 'assets'
+        self.cache_dir = self.base_dir / '.giraffe-cache'
+
+        # Parsed frontmatter from previous builds, keyed by markdown path
+        self._meta_cache = self.load_cache('metadata.json')
+
+        # Rendered HTML, keyed by SHA-1 of the markdown body
+        self._markdown_cache = self.load_cache('markdown.json')
 
-        # Initialize S3 client
+        # MD5s of uploaded files, keyed by path: [size, mtime_ns, md5]
+        self._md5_cache = self.load_cache('md5.json')
+        self._md5_lock = threading.Lock()
+        self._md5_pending: Dict[str, Future] = {}  # MD5s being calculated right now
+
+        # WAVs each MP3 was encoded from, keyed by MP3 path:
+        # [wav_size, wav_mtime_ns, wav_hash, encoder_settings]
+        self._mp3_cache = self.load_cache('mp3.json')
+
+        # Bucket listing, {key: (etag, size)}, filled in by load_s3_index()
+        self._s3_index = None
+
+        # Initialize S3 client (shared by all upload threads)
         self.s3_client = None
         if self.config.aws_access_key and self.config.aws_secret_key:
             try:
-                self.s3_client = boto3.client(
-                    's3',
+                session = boto3.session.Session(
                     aws_access_key_id=self.config.aws_access_key,
                     aws_secret_access_key=self.config.aws_secret_key,
                     region_name=self.config.aws_region
                 )
+                self.s3_client = session.client(
+                    's3',
+                    config=BotoConfig(
+                        max_pool_connections=self.config.s3_max_pool_connections,
+                        retries={'mode': 'adaptive', 'max_attempts': 10},
+                        tcp_keepalive=True
+                    )
+                )
             except Exception as e:
-                print(f"Warning: Could not initialize S3 client: {e}")
+                log.warning(f"Warning: Could not initialize S3 client: {e}")
+
+        # Upload large files (WAVs) as multipart with parts sent in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=self.config.s3_multipart_chunksize_mb * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True
+        )
+
+        # Initialize Jinja2, keeping compiled templates between builds
+        jinja_cache_dir = self.cache_dir / 'jinja'
+        jinja_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.jinja_env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            bytecode_cache=FileSystemBytecodeCache(str(jinja_cache_dir)),
+            auto_reload=False
+        )
+
+        # Site-wide values shared by every page
+        self.jinja_env.globals.update(
+            site_title=self.config.site_title,
+            site_description=self.config.site_description,
+            github_username=self.config.github_username
+        )
 
-        # Initialize Jinja2
-        self.jinja_env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+    def load_cache(self, name: str) -> Dict:
+        """Load a JSON cache file from the cache directory"""
+        try:
+            return json.loads((self.cache_dir / name).read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log.warning(f"Warning: Ignoring unreadable cache {name}: {e}")
+            return {}
+
+    def save_cache(self, name: str, data: Dict) -> None:
+        """Write a JSON cache file to the cache directory"""
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            # Dates in frontmatter are stored as strings
+            (self.cache_dir / name).write_text(json.dumps(data, default=str), encoding='utf-8')
+        except OSError as e:
+            log.warning(f"Warning: Could not write cache {name}: {e}")
 
     def check_dependencies(self) -> bool:
         """Check if required tools are installed"""
-        try:
-            result = subprocess.run(['ffmpeg', '-version'],
-                                  capture_output=True,
-                                  text=True,
-                                  timeout=5)
-            if result.returncode != 0:
-                print("Error: ffmpeg not found. Please install ffmpeg.")
-                return False
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            print("Error: ffmpeg not found. Please install ffmpeg.")
-            print("Install with: sudo apt install ffmpeg")
+        if shutil.which('ffmpeg') is None:
+            log.error("Error: ffmpeg not found. Please install ffmpeg.")
+            log.error("Install with: sudo apt install ffmpeg")
             return False
 
         return True
@@ -222,91 +564,431 @@ class GiraffeBuilder:
         tracks = []
 
         if not self.tracks_dir.exists():
-            print(f"Error: Tracks directory not found: {self.tracks_dir}")
+            log.error(f"Error: Tracks directory not found: {self.tracks_dir}")
             return tracks
 
-        for track_dir in sorted(self.tracks_dir.iterdir(), reverse=True):
-            if not track_dir.is_dir():
-                continue
-
+        # DirEntry.is_dir() uses the type from readdir, avoiding a stat() per entry
+        with os.scandir(self.tracks_dir) as it:
             # Skip example track if it doesn't have real files
-            if track_dir.name == 'example-track':
-                continue
+            entries = sorted((entry for entry in it
+                              if entry.is_dir() and entry.name != 'example-track'),
+                             key=lambda entry: entry.name,
+                             reverse=True)
 
-            print(f"Processing: {track_dir.name}")
+        def load_track(track_dir: Path) -> tuple[Track, str]:
             track = Track(track_dir)
 
-            if not track.load_metadata():
-                print(f"  Skipping due to metadata error")
-                continue
+            if not track.load_metadata(self._meta_cache, self._markdown_cache):
+                return (track, "metadata error")
 
             if not track.find_files():
-                print(f"  Skipping due to missing files")
+                return (track, "missing files")
+
+            return (track, "")
+
+        # Track folders are read in parallel; results come back in order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(load_track, (Path(entry.path) for entry in entries)))
+
+        for track, error in results:
+            log.info(f"Processing: {track.slug}")
+
+            if error:
+                log.info(f"  Skipping due to {error}")
                 continue
 
             tracks.append(track)
-            print(f"  ✓ Loaded: {track.title}")
+            log.info(f"  ✓ Loaded: {track.title}")
+
+        # Keep only entries for the markdown files and bodies seen in this scan,
+        # so deleted tracks and old edits don't pile up
+        md_paths = {str(track.md_path) for track, _ in results if track.md_path}
+        digests = {track.content_digest for track, _ in results if track.content_digest}
+        self._meta_cache = {path: entry for path, entry in self._meta_cache.items()
+                            if path in md_paths}
+        self._markdown_cache = {digest: html for digest, html in self._markdown_cache.items()
+                                if digest in digests}
+        self.save_cache('metadata.json', self._meta_cache)
+        self.save_cache('markdown.json', self._markdown_cache)
 
         return tracks
 
-    def encode_mp3(self, track: Track) -> Optional[Path]:
-        """Encode WAV to MP3 using ffmpeg"""
-        mp3_path = track.directory / f"{track.slug}.mp3"
+    def track_fingerprints(self, tracks: List[Track]) -> Dict[str, str]:
+        """Fingerprint everything each track's audio and page are built from
+
+        Covers the track's markdown, WAV and images, the templates, and the
+        settings that end up in the output. Returns {slug: fingerprint}.
+        """
+        base = hashlib.blake2b(digest_size=16)
+        settings = (
+            self.static_only,
+            self.keep_local,
+            bool(self.s3_client and self.config.s3_bucket),  # Whether audio is uploaded
+            self.config.s3_bucket,
+            self.config.s3_base_url,
+            self.config.mp3_bitrate,
+            self.config.mp3_quality,
+            self.config.site_title,
+            self.config.site_description,
+            self.config.github_username,
+        )
+        base.update(repr(settings).encode('utf-8'))
+        for template in sorted(self.templates_dir.iterdir()):
+            stat = template.stat()
+            base.update(f"{template}:{stat.st_mtime_ns}:{stat.st_size}\n".encode('utf-8'))
+
+        fingerprints = {}
+        for track in tracks:
+            h = base.copy()
+            for path in [track.md_path, track.wav_path, *track.image_paths]:
+                stat = path.stat()
+                h.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size}\n".encode('utf-8'))
+            fingerprints[track.slug] = h.hexdigest()
+
+        return fingerprints
 
-        # Skip if MP3 already exists and is newer than WAV
+    def restore_audio(self, track: Track) -> None:
+        """Point an unchanged track at the audio produced by a previous build"""
+        mp3_path = track.directory / f"{track.slug}.mp3"
         if mp3_path.exists():
-            if mp3_path.stat().st_mtime > track.wav_path.stat().st_mtime:
-                print(f"  ✓ MP3 already exists and is up to date")
-                return mp3_path
-
-        print(f"  Encoding MP3...")
-
-        cmd = [
-            'ffmpeg',
-            '-i', str(track.wav_path),
-            '-codec:a', 'libmp3lame',
-            '-b:a', f'{self.config.mp3_bitrate}k',
-            '-q:a', self.config.mp3_quality,
-            '-y',  # Overwrite output file
-            str(mp3_path)
-        ]
+            track.mp3_path = mp3_path
+
+        if self.s3_client and self.config.s3_bucket:
+            track.mp3_url = f"{self.config.s3_base_url}/{track.slug}/{track.slug}.mp3"
+            track.wav_url = f"{self.config.s3_base_url}/{track.slug}/{track.slug}.wav"
+
+    def encoder_settings(self) -> str:
+        """Describe the ffmpeg settings that affect the encoded MP3"""
+        return ' '.join(['libmp3lame',
+                         *_lame_args(self.config.mp3_bitrate, self.config.mp3_quality)])
+
+    def mp3_is_current(self, track: Track, mp3_path: Path) -> bool:
+        """Check whether mp3_path was encoded from the track's current WAV
+
+        The WAV's size and mtime are compared first. If only the mtime
+        changed (a touch or a fresh checkout), the WAV's content hash
+        decides, so an unchanged WAV is never re-encoded. An MP3 with no
+        record was encoded with unknown settings and is re-encoded once.
+        """
+        if not mp3_path.exists():
+            return False
+
+        wav_stat = track.wav_path.stat()
+        cached = self._mp3_cache.get(str(mp3_path))
+        if cached is None:
+            return False
+
+        wav_size, wav_mtime_ns, wav_hash, settings = cached
+        if settings != self.encoder_settings() or wav_size != wav_stat.st_size:
+            return False
+        if wav_mtime_ns == wav_stat.st_mtime_ns:
+            return True
+        if _file_hash(track.wav_path) != wav_hash:
+            return False
+
+        # Same audio, just a new mtime
+        self._mp3_cache[str(mp3_path)] = (wav_size, wav_stat.st_mtime_ns, wav_hash, settings)
+        return True
+
+    def record_mp3(self, track: Track, mp3_path: Path, wav_hash: str) -> None:
+        """Remember which WAV (by its content hash) and settings mp3_path was encoded from"""
+        wav_stat = track.wav_path.stat()
+        self._mp3_cache[str(mp3_path)] = (
+            wav_stat.st_size,
+            wav_stat.st_mtime_ns,
+            wav_hash,
+            self.encoder_settings()
+        )
+
+    def process_tracks(self, tracks: List[Track]) -> None:
+        """Encode WAV to MP3 and upload audio to S3 for all tracks
+
+        When S3 is configured, MP3s are streamed straight to the bucket
+        unless keep_local is set. Otherwise ffmpeg encodes run from their own
+        thread pool. Every upload is a separate job in one thread pool: WAVs and
+        cached MP3s start right away, and each newly encoded MP3 is queued as
+        soon as it is ready, so network I/O overlaps with encoding. Sets
+        track.mp3_path for every track that has an up-to-date MP3.
+        """
+        upload = bool(self.s3_client and self.config.s3_bucket)
+        if upload:
+            self.load_s3_index()
+        else:
+            log.warning(f"  ⚠ Skipping S3 upload (not configured)")
+
+        if upload and not self.keep_local:
+            self.stream_tracks(tracks)
+            return
+
+        # Touched WAVs are hashed to tell whether they changed, so check in parallel
+        mp3_paths = [track.directory / f"{track.slug}.mp3" for track in tracks]
+        with ThreadPoolExecutor(max_workers=self.config.encode_jobs) as executor:
+            current = list(executor.map(self.mp3_is_current, tracks, mp3_paths))
+
+        pending = []
+        for track, mp3_path, is_current in zip(tracks, mp3_paths, current):
+            # Skip if MP3 was already encoded from this WAV
+            if is_current:
+                track.mp3_path = mp3_path
+                continue
+
+            pending.append((track, mp3_path))
+
+        up_to_date = len(tracks) - len(pending)
+        if up_to_date:
+            log.info(f"  ✓ {up_to_date} MP3(s) already exist and are up to date")
+
+        workers = max(1, min(self.config.encode_jobs, len(pending)))
+        if pending:
+            log.info(f"  Encoding {len(pending)} MP3(s) with {workers} worker(s)...")
+
+        # ffmpeg runs as its own process, so threads are enough to drive it.
+        # (A process pool would be forked from a process with live boto3 threads.)
+        with ThreadPoolExecutor(max_workers=workers) as enc_pool, \
+                ThreadPoolExecutor(max_workers=self.config.upload_jobs) as net_pool:
+            uploads = []
+
+            # Cached MP3s and all WAVs can start uploading right away
+            if upload:
+                for track in tracks:
+                    if track.mp3_path:
+                        uploads.append(net_pool.submit(self.upload_mp3, track))
+                for track in tracks:
+                    uploads.append(net_pool.submit(self.upload_wav, track))
+
+            futures = {
+                enc_pool.submit(_encode_mp3,
+                                track.wav_path,
+                                mp3_path,
+                                self.config.mp3_bitrate,
+                                self.config.mp3_quality,
+                                _ffmpeg_threads(workers)): track
+                for track, mp3_path in pending
+            }
+            for future in as_completed(futures):
+                track = futures[future]
+                mp3_path, wav_hash, error = future.result()
+                if not mp3_path:
+                    log.error(f"  Error encoding {track.title}: {error}")
+                    log.warning(f"  ⚠ Skipping {track.title} due to encoding error")
+                    continue
+
+                track.mp3_path = mp3_path
+                self.record_mp3(track, mp3_path, wav_hash)
+                log.info(f"  ✓ MP3 encoded: {track.title}")
+                if upload:
+                    uploads.append(net_pool.submit(self.upload_mp3, track))
+
+            failed = sum(1 for future in as_completed(uploads) if not future.result())
+            if failed:
+                log.warning(f"  ⚠ {failed} file(s) failed to upload")
+
+    def stream_tracks(self, tracks: List[Track]) -> None:
+        """Encode and upload all tracks without writing MP3s to disk
+
+        MP3s are encoded and streamed from their own pool of
+        GIRAFFE_ENCODE_JOBS workers, so WAV uploads never wait behind them.
+        """
+        encoders = max(1, min(self.config.encode_jobs, len(tracks)))
+        uploaders = max(1, min(self.config.upload_jobs, len(tracks)))
+        threads = _ffmpeg_threads(encoders)
+        log.info(f"  Streaming MP3s to S3 with {encoders} encoder(s) "
+                 f"and {uploaders} WAV upload worker(s)...")
+        with ThreadPoolExecutor(max_workers=encoders) as enc_pool, \
+                ThreadPoolExecutor(max_workers=uploaders) as net_pool:
+            jobs = [net_pool.submit(self.upload_wav, track) for track in tracks]
+            jobs += [enc_pool.submit(self.encode_and_upload, track, threads) for track in tracks]
+            failed = sum(1 for future in as_completed(jobs) if not future.result())
+
+        if failed:
+            log.warning(f"  ⚠ {failed} file(s) failed to encode or upload")
+
+    def encode_and_upload(self, track: Track, threads: int = 0) -> bool:
+        """Pipe ffmpeg's MP3 output straight into S3 and record its URL
+
+        The MP3 object records the WAV's mtime and MD5 and the encoder
+        settings. It is re-encoded when the settings change or the WAV's
+        content does; a WAV that was only touched is recognised by its MD5.
+        threads=0 lets ffmpeg pick its own thread count.
+        """
+        mp3_key = f"{track.slug}/{track.slug}.mp3"
+        source_mtime = str(track.wav_path.stat().st_mtime_ns)
+        encoder = self.encoder_settings()
 
         try:
-            result = subprocess.run(cmd,
-                                  capture_output=True,
-                                  text=True,
-                                  timeout=300)
-            if result.returncode == 0:
-                print(f"  ✓ MP3 encoded successfully")
-                return mp3_path
+            comparison = ""
+            if self._s3_index is None or mp3_key in self._s3_index:
+                try:
+                    response = self.s3_client.head_object(Bucket=self.config.s3_bucket, Key=mp3_key)
+                    existing = response.get('Metadata', {})
+                    if existing.get('encoder') == encoder:
+                        if existing.get('source-mtime') == source_mtime:
+                            comparison = "source mtime"
+                        elif (existing.get('source-md5')
+                                and existing['source-md5'] == self.cached_md5(track.wav_path)):
+                            comparison = "source MD5"
+                except ClientError as e:
+                    if e.response['Error']['Code'] != '404':
+                        log.warning(f"  ⚠ Error checking S3: {e}")
+
+            if comparison:
+                log.info(f"  ✓ {mp3_key} already on S3 (unchanged, {comparison} match)")
             else:
-                print(f"  Error encoding MP3: {result.stderr}")
-                return None
-        except subprocess.TimeoutExpired:
-            print(f"  Error: ffmpeg timed out")
-            return None
+                metadata = {
+                    'source-mtime': source_mtime,
+                    'source-md5': self.cached_md5(track.wav_path),
+                    'encoder': encoder
+                }
+                cmd = [
+                    'ffmpeg',
+                    '-nostdin',  # Never wait on the terminal
+                    '-hide_banner',
+                    '-nostats',
+                    '-loglevel', 'error',  # Only report failures
+                    '-i', str(track.wav_path),
+                    '-codec:a', 'libmp3lame',
+                    *_lame_args(self.config.mp3_bitrate, self.config.mp3_quality),
+                    '-threads', str(threads),
+                    '-f', 'mp3',
+                    'pipe:1'
+                ]
+                # stderr goes to a temp file so a chatty ffmpeg can't block on a full pipe
+                with tempfile.TemporaryFile() as stderr:
+                    log.info(f"  Streaming {mp3_key}...")
+                    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr)
+
+                    # Kill a stalled ffmpeg so the upload sees EOF instead of waiting forever
+                    guard = _StallGuard(proc, _FFMPEG_TIMEOUT)
+                    try:
+                        self.s3_client.upload_fileobj(
+                            guard,
+                            self.config.s3_bucket,
+                            mp3_key,
+                            ExtraArgs={
+                                'ContentType': 'audio/mpeg',
+                                'Metadata': metadata
+                            },
+                            Config=self.transfer_config
+                        )
+                    finally:
+                        guard.close()
+                        proc.stdout.close()
+                        returncode = proc.wait()
+
+                    if returncode != 0:
+                        # Don't leave a truncated MP3 behind
+                        self.s3_client.delete_object(Bucket=self.config.s3_bucket, Key=mp3_key)
+                        if guard.timed_out:
+                            error = "ffmpeg stopped producing output"
+                        else:
+                            stderr.seek(0)
+                            error = stderr.read().decode('utf-8', errors='replace')
+                        log.error(f"  Error encoding {track.title}: {error}")
+                        return False
+
+                log.info(f"  ✓ Streamed {mp3_key}")
+
+            track.mp3_url = f"{self.config.s3_base_url}/{mp3_key}"
+
+            return True
+
+        except ClientError as e:
+            log.error(f"  Error uploading {mp3_key} to S3: {e}")
+            return False
         except Exception as e:
-            print(f"  Error: {e}")
-            return None
+            log.error(f"  Error uploading {mp3_key}: {e}")
+            return False
 
     def calculate_md5(self, file_path: Path) -> str:
         """Calculate MD5 hash of a file"""
-        hash_md5 = hashlib.md5()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            try:
+                # Python 3.11+: hashes in C without a Python-level read loop
+                return hashlib.file_digest(f, 'md5').hexdigest()
+            except AttributeError:
+                hash_md5 = hashlib.md5()
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    hash_md5.update(chunk)
+                return hash_md5.hexdigest()
+
+    def cached_md5(self, file_path: Path) -> str:
+        """Calculate MD5 hash of a file, reusing the result while it is unchanged
+
+        Threads asking for the same file at the same time share one
+        calculation, so a WAV is never read twice in parallel.
+        """
+        key = str(file_path)
+        stat = file_path.stat()
+        with self._md5_lock:
+            cached = self._md5_cache.get(key)
+            if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+                return cached[2]
+            pending = self._md5_pending.get(key)
+            if pending is None:
+                pending = self._md5_pending[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return pending.result()
 
-    def file_needs_upload(self, local_path: Path, s3_key: str) -> tuple[bool, Optional[str]]:
+        try:
+            md5 = self.calculate_md5(file_path)
+            self._md5_cache[key] = (stat.st_size, stat.st_mtime_ns, md5)
+            pending.set_result(md5)
+            return md5
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        finally:
+            with self._md5_lock:
+                del self._md5_pending[key]
+
+    def load_s3_index(self) -> None:
+        """List the bucket once so upload checks can skip per-file HEAD requests"""
+        self._s3_index = None
+        try:
+            index = {}
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=self.config.s3_bucket):
+                for obj in page.get('Contents', []):
+                    index[obj['Key']] = (obj['ETag'].strip('"'), obj['Size'])
+            self._s3_index = index
+        except (ClientError, BotoCoreError) as e:
+            log.warning(f"  ⚠ Could not list S3 bucket, checking files one by one: {e}")
+
+    def file_needs_upload(self, local_path: Path, s3_key: str) -> tuple[bool, Optional[str], str]:
         """Check if local file needs to be uploaded to S3
 
+        Uses the bucket listing from load_s3_index() when available, and
+        only sends a HEAD request for multipart objects, whose ETag is not
+        an MD5. Objects uploaded by this script carry the local file's mtime
+        in their metadata, so an unchanged multipart file is detected
+        without hashing it.
+
         Returns:
-            tuple: (needs_upload: bool, etag: Optional[str])
+            tuple: (needs_upload: bool, etag: Optional[str], comparison: str)
             - needs_upload: True if file should be uploaded, False to skip
             - etag: S3 ETag if file exists, None otherwise
+            - comparison: How the files were compared ("mtime", "size" or "MD5")
         """
         if not self.s3_client:
-            return (True, None)
+            return (True, None, "")
+
+        if self._s3_index is not None:
+            listed = self._s3_index.get(s3_key)
+            if listed is None:
+                return (True, None, "")  # Not in the bucket, need upload
+
+            s3_etag, s3_size = listed
+            if s3_size != local_path.stat().st_size:
+                return (True, s3_etag, "size")  # Different size, needs upload
+
+            if '-' not in s3_etag:
+                # Simple upload - compare MD5 hash
+                local_md5 = self.cached_md5(local_path)
+                return (s3_etag != local_md5, s3_etag, "MD5")
 
         try:
             # Check if file exists in S3 and get its ETag
@@ -316,212 +998,261 @@ class GiraffeBuilder:
             )
             s3_etag = response['ETag'].strip('"')  # Remove quotes from ETag
             s3_size = response.get('ContentLength', 0)
+            s3_mtime = response.get('Metadata', {}).get('local-mtime')
+
+            # Get local file size and mtime
+            local_stat = local_path.stat()
+            local_size = local_stat.st_size
 
-            # Get local file size
-            local_size = local_path.stat().st_size
+            if s3_size != local_size:
+                return (True, s3_etag, "size")  # Different size, needs upload
+
+            # Same size and same mtime as the file we uploaded last time
+            if s3_mtime == str(local_stat.st_mtime_ns):
+                return (False, s3_etag, "mtime")
 
             # Check if ETag indicates multipart upload (contains hyphen)
             if '-' in s3_etag:
-                # Multipart upload - compare file sizes instead of MD5
-                if s3_size == local_size:
-                    return (False, s3_etag)  # Same size, likely unchanged
+                # Multipart upload - no MD5 to compare against
+                if s3_mtime is None:
+                    return (False, s3_etag, "size")  # Legacy upload, same size, likely unchanged
                 else:
-                    return (True, s3_etag)  # Different size, needs upload
+                    return (True, s3_etag, "mtime")  # Local file modified since upload
             else:
                 # Simple upload - compare MD5 hash
-                local_md5 = self.calculate_md5(local_path)
+                local_md5 = self.cached_md5(local_path)
 
                 if s3_etag == local_md5:
-                    return (False, s3_etag)  # Hash matches, skip upload
+                    return (False, s3_etag, "MD5")  # Hash matches, skip upload
                 else:
-                    return (True, s3_etag)  # Hash differs, need upload
+                    return (True, s3_etag, "MD5")  # Hash differs, need upload
 
         except self.s3_client.exceptions.ClientError as e:
             if e.response['Error']['Code'] == '404':
-                return (True, None)  # File doesn't exist, need upload
+                return (True, None, "")  # File doesn't exist, need upload
             else:
                 # Other error, safer to attempt upload
-                print(f"  ⚠ Error checking S3: {e}")
-                return (True, None)
-
-    def upload_to_s3(self, track: Track, mp3_path: Path) -> bool:
-        """Upload WAV and MP3 files to S3"""
-        if not self.s3_client or not self.config.s3_bucket:
-            print(f"  ⚠ Skipping S3 upload (not configured)")
-            return False
+                log.warning(f"  ⚠ Error checking S3: {e}")
+                return (True, None, "")
 
+    def upload_file(self, local_path: Path, s3_key: str, content_type: str) -> bool:
+        """Upload a single file to S3 unless an identical copy is already there"""
         try:
-            # Upload MP3
-            mp3_key = f"{track.slug}/{track.slug}.mp3"
-            needs_upload, etag = self.file_needs_upload(mp3_path, mp3_key)
-
-            if needs_upload:
-                print(f"  Uploading MP3 to S3...")
-                self.s3_client.upload_file(
-                    str(mp3_path),
-                    self.config.s3_bucket,
-                    mp3_key,
-                    ExtraArgs={'ContentType': 'audio/mpeg'}
-                )
-                print(f"  ✓ MP3 uploaded")
-            else:
-                etag_display = etag[:8] if etag else "unknown"
-                comparison = "size" if etag and '-' in etag else "MD5"
-                print(f"  ✓ MP3 already on S3 (unchanged, {comparison} match, ETag: {etag_display}...)")
-
-            track.mp3_url = f"{self.config.s3_base_url}/{mp3_key}"
-
-            # Upload WAV
-            wav_key = f"{track.slug}/{track.slug}.wav"
-            if not track.wav_path:
-                print(f"  ⚠ WAV file path not found, skipping upload")
-                return False
-
-            needs_upload, etag = self.file_needs_upload(track.wav_path, wav_key)
+            needs_upload, etag, comparison = self.file_needs_upload(local_path, s3_key)
 
             if needs_upload:
-                print(f"  Uploading WAV to S3...")
+                log.info(f"  Uploading {s3_key}...")
                 self.s3_client.upload_file(
-                    str(track.wav_path),
+                    str(local_path),
                     self.config.s3_bucket,
-                    wav_key,
-                    ExtraArgs={'ContentType': 'audio/wav'}
+                    s3_key,
+                    ExtraArgs={
+                        'ContentType': content_type,
+                        'Metadata': {'local-mtime': str(local_path.stat().st_mtime_ns)}
+                    },
+                    Config=self.transfer_config
                 )
-                print(f"  ✓ WAV uploaded")
+                log.info(f"  ✓ Uploaded {s3_key}")
             else:
                 etag_display = etag[:8] if etag else "unknown"
-                comparison = "size" if etag and '-' in etag else "MD5"
-                print(f"  ✓ WAV already on S3 (unchanged, {comparison} match, ETag: {etag_display}...)")
-
-            track.wav_url = f"{self.config.s3_base_url}/{wav_key}"
+                log.info(f"  ✓ {s3_key} already on S3 (unchanged, {comparison} match, ETag: {etag_display}...)")
 
             return True
 
         except ClientError as e:
-            print(f"  Error uploading to S3: {e}")
+            log.error(f"  Error uploading {s3_key} to S3: {e}")
             return False
         except Exception as e:
-            print(f"  Error: {e}")
+            log.error(f"  Error uploading {s3_key}: {e}")
+            return False
+
+    def upload_mp3(self, track: Track) -> bool:
+        """Upload a track's MP3 to S3 and record its URL"""
+        mp3_key = f"{track.slug}/{track.slug}.mp3"
+        if not self.upload_file(track.mp3_path, mp3_key, 'audio/mpeg'):
             return False
+        track.mp3_url = f"{self.config.s3_base_url}/{mp3_key}"
+        return True
+
+    def upload_wav(self, track: Track) -> bool:
+        """Upload a track's WAV to S3 and record its URL"""
+        wav_key = f"{track.slug}/{track.slug}.wav"
+        if not self.upload_file(track.wav_path, wav_key, 'audio/wav'):
+            return False
+        track.wav_url = f"{self.config.s3_base_url}/{wav_key}"
+        return True
 
-    def generate_site(self, tracks: List[Track]) -> bool:
-        """Generate static HTML site"""
-        print("\nGenerating static site...")
+    def generate_site(self, tracks: List[Track], unchanged: Optional[set] = None) -> bool:
+        """Generate static HTML site
+
+        Track pages for slugs in `unchanged` are already up to date and are
+        not re-rendered.
+        """
+        unchanged = unchanged or set()
+        log.info("\nGenerating static site...")
 
         # Create output directories
         self.output_dir.mkdir(exist_ok=True)
         (self.output_dir / 'tracks').mkdir(exist_ok=True)
         (self.output_dir / 'covers').mkdir(exist_ok=True)
 
-        # Copy assets
-        if self.assets_dir.exists():
+        def copy_assets() -> None:
             dest_assets = self.output_dir / 'assets'
-            if dest_assets.exists():
-                shutil.rmtree(dest_assets)
-            shutil.copytree(self.assets_dir, dest_assets)
-            print("  ✓ Copied assets")
+            shutil.copytree(self.assets_dir, dest_assets,
+                            copy_function=_copy_if_changed,
+                            dirs_exist_ok=True)
+
+            # Remove anything that no longer exists in assets/ (deepest paths first)
+            for dest in sorted(dest_assets.rglob('*'), reverse=True):
+                if not (self.assets_dir / dest.relative_to(dest_assets)).exists():
+                    if dest.is_dir() and not dest.is_symlink():
+                        shutil.rmtree(dest)
+                    else:
+                        dest.unlink()
 
         # Copy all track images
-        image_count = 0
-        for track in tracks:
-            for img_path in track.image_paths:
-                # Prefix with track slug to avoid naming collisions
-                dest_img = self.output_dir / 'covers' / f"{track.slug}-{img_path.name}"
-                shutil.copy2(img_path, dest_img)
-                image_count += 1
-        print(f"  ✓ Copied {image_count} image(s)")
-
-        # Generate track pages
-        track_template = self.jinja_env.get_template('track.html')
-        for track in tracks:
-            output_file = self.output_dir / 'tracks' / f"{track.slug}.html"
+        # Prefix with track slug to avoid naming collisions
+        copies = [(img_path, self.output_dir / 'covers' / f"{track.slug}-{img_path.name}")
+                  for track in tracks
+                  for img_path in track.image_paths]
 
-            html = track_template.render(
-                track=track,
-                site_title=self.config.site_title,
-                site_description=self.config.site_description,
-                github_username=self.config.github_username,
-                is_track=True
-            )
+        # Hashes of the images copied by previous builds, keyed by destination
+        image_cache = self.load_cache('images.json')
+
+        def copy_image(copy: tuple[Path, Path]) -> bool:
+            img_path, dest_img = copy
+
+            # Same size and mtime needs no hashing
+            if _same_stat(img_path, dest_img):
+                return False
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(html)
+            digest = _file_hash(img_path)
+            if dest_img.exists() and image_cache.get(str(dest_img)) == digest:
+                return False
+            _fast_copy(img_path, dest_img)
+            image_cache[str(dest_img)] = digest
+            return True
 
-        print(f"  ✓ Generated {len(tracks)} track pages")
+        # Assets and images are copied in the same pool so their I/O overlaps
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            assets_job = executor.submit(copy_assets) if self.assets_dir.exists() else None
+            copied = sum(executor.map(copy_image, copies))
+            if assets_job:
+                assets_job.result()
+                log.info("  ✓ Copied assets")
+        self.save_cache('images.json', image_cache)
+
+        if copied < len(copies):
+            log.info(f"  ✓ Copied {copied} image(s) ({len(copies) - copied} unchanged)")
+        else:
+            log.info(f"  ✓ Copied {copied} image(s)")
 
-        # Generate index page
+        # Generate track pages and the index page together
+        track_template = self.jinja_env.get_template('track.html')
         index_template = self.jinja_env.get_template('index.html')
-        index_html = index_template.render(
-            tracks=tracks,
-            site_title=self.config.site_title,
-            site_description=self.config.site_description,
-            github_username=self.config.github_username,
-            is_track=False
-        )
 
-        with open(self.output_dir / 'index.html', 'w', encoding='utf-8') as f:
-            f.write(index_html)
+        def render_track(track: Track) -> None:
+            output_file = self.output_dir / 'tracks' / f"{track.slug}.html"
+
+            _dump_atomic(track_template.stream(track=track, is_track=True), output_file)
+
+        def render_index() -> None:
+            _dump_atomic(index_template.stream(tracks=tracks, is_track=False),
+                         self.output_dir / 'index.html')
 
-        print("  ✓ Generated index page")
+        changed = [track for track in tracks if track.slug not in unchanged]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            index_job = executor.submit(render_index)
+            list(executor.map(render_track, changed))
+            index_job.result()
+
+        if unchanged:
+            log.info(f"  ✓ Generated {len(changed)} track pages ({len(tracks) - len(changed)} unchanged)")
+        else:
+            log.info(f"  ✓ Generated {len(tracks)} track pages")
+
+        log.info("  ✓ Generated index page")
 
         return True
 
     def build(self) -> bool:
         """Main build process"""
-        print("=" * 60)
-        print("Giraffe - Music Portfolio Builder")
+        log.info("=" * 60)
+        log.info("Giraffe - Music Portfolio Builder")
         if self.static_only:
-            print("(Static-only mode: skipping audio processing)")
-        print("=" * 60)
+            log.info("(Static-only mode: skipping audio processing)")
+        log.info("=" * 60)
 
         # Check dependencies (skip in static-only mode)
         if not self.static_only and not self.check_dependencies():
             return False
 
         # Scan tracks
-        print("\nScanning tracks directory...")
+        log.info("\nScanning tracks directory...")
         tracks = self.scan_tracks()
 
         if not tracks:
-            print("\nNo valid tracks found to process.")
-            print("Add tracks to the 'tracks/' directory and try again.")
+            log.info("\nNo valid tracks found to process.")
+            log.info("Add tracks to the 'tracks/' directory and try again.")
             return False
 
-        print(f"\nFound {len(tracks)} track(s) to process\n")
-
-        # Process each track
+        log.info(f"\nFound {len(tracks)} track(s) to process\n")
+
+        # Skip tracks whose inputs haven't changed since the last successful build
+        fingerprints = self.track_fingerprints(tracks)
+        previous = self.load_cache('tracks.json')
+        unchanged = {
+            track.slug for track in tracks
+            if previous.get(track.slug) == fingerprints[track.slug]
+            and (self.output_dir / 'tracks' / f"{track.slug}.html").exists()
+        }
+        if unchanged:
+            log.info(f"{len(unchanged)} track(s) unchanged since last build\n")
+
+        # Encode and upload audio
+        upload = bool(self.s3_client and self.config.s3_bucket)
         if not self.static_only:
-            for i, track in enumerate(tracks, 1):
-                print(f"[{i}/{len(tracks)}] {track.title}")
-
-                # Encode MP3
-                mp3_path = self.encode_mp3(track)
-                if not mp3_path:
-                    print(f"  ⚠ Skipping due to encoding error")
-                    continue
-
-                track.mp3_path = mp3_path
-
-                # Upload to S3
-                self.upload_to_s3(track, mp3_path)
-
-                print()
+            for track in tracks:
+                if track.slug in unchanged:
+                    self.restore_audio(track)
+
+            changed = [track for track in tracks if track.slug not in unchanged]
+            if changed:
+                log.info("Processing audio...")
+                self.process_tracks(changed)
+                self.save_cache('md5.json', self._md5_cache)
+                self.save_cache('mp3.json', self._mp3_cache)
+                log.info("")
         else:
-            print("Skipping audio encoding and upload (static-only mode)\n")
+            log.info("Skipping audio encoding and upload (static-only mode)\n")
 
         # Generate static site
-        if not self.generate_site(tracks):
+        if not self.generate_site(tracks, unchanged):
             return False
 
-        print("\n" + "=" * 60)
-        print("✓ Build complete!")
-        print("=" * 60)
-        print(f"\nGenerated site in: {self.output_dir}")
-        print("\nNext steps:")
-        print("1. Review the generated site in docs/index.html")
-        print("2. Commit and push to GitHub")
-        print("3. Enable GitHub Pages from the 'docs' folder")
-        print()
+        # Remember tracks that built completely so the next build can skip them.
+        # A bucket that is set but couldn't be used means uploads were skipped,
+        # so nothing is recorded until they have happened.
+        upload_skipped = bool(self.config.s3_bucket) and not upload
+        built = {}
+        for track in tracks:
+            has_audio = bool(track.mp3_path or track.mp3_url)
+            uploaded = bool(track.mp3_url and track.wav_url) or not upload
+            if self.static_only or (not upload_skipped and (
+                    track.slug in unchanged or (has_audio and uploaded))):
+                built[track.slug] = fingerprints[track.slug]
+        self.save_cache('tracks.json', built)
+
+        log.info("\n" + "=" * 60)
+        log.info("✓ Build complete!")
+        log.info("=" * 60)
+        log.info(f"\nGenerated site in: {self.output_dir}")
+        log.info("\nNext steps:")
+        log.info("1. Review the generated site in docs/index.html")
+        log.info("2. Commit and push to GitHub")
+        log.info("3. Enable GitHub Pages from the 'docs' folder")
+        log.info("")
 
         return True
 
@@ -535,6 +1266,7 @@ def main():
 Examples:
   python build.py                    # Full build (encode, upload, generate)
   python build.py --static-only      # Only regenerate HTML/CSS (skip audio)
+  python build.py --keep-local       # Write MP3s to disk before uploading
         """
     )
     parser.add_argument(
@@ -542,11 +1274,27 @@ Examples:
         action='store_true',
         help='Skip audio encoding and S3 upload, only regenerate static site'
     )
+    parser.add_argument(
+        '--keep-local',
+        action='store_true',
+        help='Write encoded MP3s to disk before uploading instead of streaming them to S3'
+    )
 
     args = parser.parse_args()
 
-    builder = GiraffeBuilder(static_only=args.static_only)
-    success = builder.build()
+    # Worker threads only enqueue log records; one listener thread writes them
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    handler = logging.handlers.QueueHandler(log_queue)
+    log.addHandler(handler)
+    log.setLevel(logging.INFO)
+    listener.start()
+    try:
+        builder = GiraffeBuilder(static_only=args.static_only, keep_local=args.keep_local)
+        success = builder.build()
+    finally:
+        log.removeHandler(handler)
+        listener.stop()
     sys.exit(0 if success else 1)
 
 